@@ -3,10 +3,11 @@ import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
-from datetime import datetime
-from github_analyzer import GitHubRepoAnalyzer
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
+import orjson
+import functools
+import os
+from datetime import datetime, date
+from github_analyzer import GitHubRepoAnalyzer, DiskCache
 from io import BytesIO
 import base64
 
@@ -18,24 +19,25 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS (theme colors live in .streamlit/config.toml)
+CUSTOM_CSS = """
 <style>
     .main-header {font-size: 3rem; color: #6e5494; margin-bottom: 0.5rem;}
     .sub-header {font-size: 1.5rem; color: #4078c0; margin-top: 1.5rem;}
-    .metric-card {background-color: #f0f2f6; padding: 20px; border-radius: 10px; text-align: center; margin-bottom: 10px; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);}
-    .metric-value {font-size: 2rem; font-weight: bold; color: #6e5494;}
-    .metric-label {font-size: 1rem; color: #666;}
-    .repo-card {background-color: #f9f9f9; padding: 15px; border-radius: 10px; margin-bottom: 10px; border-left: 4px solid #6e5494;}
-    .info-box {background-color: #e6f7ff; padding: 15px; border-radius: 10px; margin-bottom: 15px; border-left: 4px solid #1890ff;}
-    .warning-box {background-color: #fff7e6; padding: 15px; border-radius: 10px; margin-bottom: 15px; border-left: 4px solid #fa8c16;}
-    .success-box {background-color: #f6ffed; padding: 15px; border-radius: 10px; margin-bottom: 15px; border-left: 4px solid #52c41a;}
-    .tab-content {padding: 20px 0;}
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+def sub_header(text):
+    """Render a styled section header as a single HTML element"""
+    st.html(f'<div class="sub-header">{text}</div>')
+
+def format_mean(value, spec):
+    """Format an average, or 'Not fetched' when no repo had the count (all skipped forks/archived)"""
+    return 'Not fetched' if pd.isna(value) else format(value, spec)
 
 # App header
-st.markdown('<h1 class="main-header">GitHub Repository Analyzer Pro</h1>', unsafe_allow_html=True)
+st.html('<h1 class="main-header">GitHub Repository Analyzer Pro</h1>')
 st.write("Comprehensive analysis of GitHub users' repositories, programming languages, and development activity.")
 
 # Sidebar for input
@@ -48,6 +50,8 @@ with st.sidebar:
     include_user_info = st.checkbox("Include User Profile", value=True)
     include_activity = st.checkbox("Include Activity Analysis", value=True)
     include_tech_stack = st.checkbox("Include Tech Stack Analysis", value=True)
+    include_forks = st.checkbox("Fetch Details for Forks & Archived Repos", value=False,
+                                help="Forks and archived repos otherwise skip their per-repo detail requests")
     
     analyze_button = st.button("Analyze Repositories", type="primary")
     
@@ -55,6 +59,7 @@ with st.sidebar:
     st.info("""
     **Tips:**
     - Add a GITHUB_TOKEN in .env for higher rate limits
+    - Set GITHUB_TOKENS (comma-separated) to rotate through several tokens
     - For organizations, use the organization name
     - Private repos are only visible with proper authentication
     """)
@@ -62,482 +67,545 @@ with st.sidebar:
     # Rate limit info placeholder
     rate_limit_placeholder = st.empty()
 
+@st.cache_resource
+def get_analyzer():
+    """Share one analyzer (and its HTTP session) across reruns"""
+    return GitHubRepoAnalyzer()
+
 # Initialize analyzer
-analyzer = GitHubRepoAnalyzer()
+analyzer = get_analyzer()
 
-if analyze_button and username:
-    with st.spinner(f"Fetching data for {username}..."):
-        # Get user info
-        user_info = analyzer.get_user_info(username) if include_user_info else None
-        
-        # Get repositories
-        repos = analyzer.get_user_repos(username)
-        
-        # Get user activity
-        events = analyzer.get_user_activity(username) if include_activity else None
+CACHE_TTL = 24 * 60 * 60  # Cached API results expire after a day
+PROFILE_CACHE_TTL = 60 * 60  # Profile and activity change faster than the repo list
+REPOS_PER_PAGE = 20
+
+# Health score lookup tables: thresholds ascend, labels/scores follow bucket order
+ACTIVITY_BINS = np.array([30, 90, 180])  # Average days since update
+ACTIVITY_LABELS = np.array(["Very Active", "Active", "Moderately Active", "Inactive"])
+ACTIVITY_SCORES = np.array([30, 20, 10, 0])
+ENGAGEMENT_BINS = np.array([1, 10, 50])  # Average of stars and forks
+ENGAGEMENT_LABELS = np.array(["Minimal Engagement", "Low Engagement", "Good Engagement", "High Engagement"])
+ENGAGEMENT_SCORES = np.array([0, 10, 20, 30])
+MAINTENANCE_LABELS = np.array(["Well Maintained", "Moderately Maintained", "Needs Attention"])
+MAINTENANCE_SCORES = np.array([40, 25, 0])
+
+# Repositories tab sort options -> repo record fields
+SORT_COLUMNS = {
+    "Stars": "stars",
+    "Forks": "forks",
+    "Recent Update": "updated_at",
+    "Size": "size",
+    "Age": "repo_age_days"
+}
+
+# Repo record fields -> export column names
+EXPORT_COLUMNS = {
+    'name': 'Name',
+    'language': 'Language',
+    'stars': 'Stars',
+    'forks': 'Forks',
+    'size': 'Size_KB',
+    'watchers': 'Watchers',
+    'open_issues': 'Open_Issues',
+    'created_at': 'Created_At',
+    'updated_at': 'Updated_At',
+    'days_since_update': 'Days_Since_Update',
+    'repo_age_days': 'Repo_Age_Days',
+    'contributors_count': 'Contributors',
+    'commits_count': 'Commits_Last_Year',
+    'license': 'License',
+    'is_fork': 'Is_Fork',
+    'archived': 'Archived'
+}
+
+# GitHub mark (Octicons, MIT), inlined so the landing page never fetches a remote image
+GITHUB_LOGO_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 16 16" width="200" height="200" fill="#24292f">'
+    '<path d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49'
+    '-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82'
+    '.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15'
+    '-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82'
+    ' 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48'
+    ' 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"/></svg>'
+)
+
+@st.cache_resource
+def _repo_cache():
+    """On-disk repo lists, shared across sessions and server restarts"""
+    return DiskCache(os.path.join('.cache', 'github', 'repos'), ttl=CACHE_TTL)
+
+@st.cache_resource
+def _analysis_cache():
+    """On-disk finished analyses, so repeat lookups on the same day skip fetching entirely"""
+    return DiskCache(os.path.join('.cache', 'github', 'analysis'), ttl=CACHE_TTL)
+
+def _fetch_repos(username, status):
+    """Fetch a user's repositories, streaming progress into the status panel on a cache miss"""
+    cached = _repo_cache().get(f"repos:{username}")
+    if cached is not None:
+        return cached
+    
+    repos = []
+    for page_repos in analyzer.iter_user_repos(username):
+        if page_repos is None:
+            return None
+        repos.extend(page_repos)
+        status.update(label=f"Fetched {len(repos)} repositories for {username}...")
+    
+    _repo_cache().set(f"repos:{username}", repos)
+    return repos
+
+@st.cache_data(ttl=PROFILE_CACHE_TTL, show_spinner=False)
+def _fetch_profile(username, include_user_info, include_activity):
+    """Fetch the user profile and activity events, cached per username and options"""
+    analyzer = get_analyzer()
+    user_info = analyzer.get_user_info(username) if include_user_info else None
+    events = analyzer.get_user_activity(username) if include_activity else None
+    return {'user_info': user_info, 'events': events}
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _analyze(analysis_key, username, include_tech_stack, include_forks, _repos):
+    """Analyze fetched repositories, cached per analysis key (the repo list is not hashed)"""
+    return get_analyzer().analyze_repos(_repos, username, include_tech_stack, include_forks)
+
+@st.cache_data(ttl=PROFILE_CACHE_TTL, show_spinner=False)
+def _readme(owner, repo_name):
+    """Fetch a repository README on demand, when its preview is opened"""
+    return get_analyzer().get_repo_readme(owner, repo_name)
+
+@functools.lru_cache(maxsize=128)
+def health_summary(avg_days_since_update, engagement, issue_ratio, archived_ratio):
+    """Score repository health; returns (score, activity, engagement, maintenance status)"""
+    activity = np.searchsorted(ACTIVITY_BINS, avg_days_since_update, side='right')
+    engaged = np.searchsorted(ENGAGEMENT_BINS, engagement, side='left')
+    maintained = np.select([(issue_ratio < 5) & (archived_ratio == 0), (issue_ratio < 10) & (archived_ratio < 0.2)],
+                           [0, 1], default=2)
+    score = ACTIVITY_SCORES[activity] + ENGAGEMENT_SCORES[engaged] + MAINTENANCE_SCORES[maintained]
+    return int(score), str(ACTIVITY_LABELS[activity]), str(ENGAGEMENT_LABELS[engaged]), str(MAINTENANCE_LABELS[maintained])
+
+def _filter_repos(repos_df, filter_language, sort_option, min_stars):
+    """Filter and sort the repo table (about a millisecond on 1,000 rows, cheaper than caching each slider value)"""
+    mask = repos_df['stars'] >= min_stars
+    if filter_language != "All":
+        mask &= repos_df['language'] == filter_language
+    return repos_df[mask].sort_values(SORT_COLUMNS[sort_option], ascending=False, kind='stable')
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _export_payloads(analysis_key, _repos_df):
+    """Serialize the export table once per analysis as gzipped CSV and JSON Lines"""
+    export_df = _repos_df[list(EXPORT_COLUMNS)].rename(columns=EXPORT_COLUMNS)
+    # Counts skipped for forks/archived repos are NaN; write them as blanks rather than 0 or 1.0
+    export_df[['Contributors', 'Commits_Last_Year']] = export_df[['Contributors', 'Commits_Last_Year']].astype('Int64')
+    buf = BytesIO()
+    # Keep GitHub's ISO 8601 timestamps in the exports
+    export_df.to_csv(buf, index=False, compression='gzip', date_format='%Y-%m-%dT%H:%M:%SZ')
+    for col in ('Created_At', 'Updated_At'):
+        export_df[col] = export_df[col].dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+    export_df = export_df.astype(object).where(export_df.notna(), None)  # Missing values -> null
+    records = export_df.to_dict(orient='records')
+    jsonl = b"\n".join(orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY) for record in records)
+    return buf.getvalue(), jsonl
+
+@st.cache_data(show_spinner=False)
+def build_lang_pie(items):
+    """Build the language distribution pie, cached on (language, count) pairs"""
+    langs, counts = zip(*items)
+    fig = go.Figure(data=[go.Pie(labels=langs, values=counts)])
+    fig.update_layout(title='Programming Languages Distribution', width=600, height=450, autosize=False)
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def _wordcloud_png(freq_items):
+    """Render the tech stack word cloud to PNG bytes, cached on (technology, count) pairs"""
+    # Imported lazily: wordcloud (and the matplotlib it pulls in) is only needed for this tab
+    from wordcloud import WordCloud
+    
+    wordcloud = WordCloud(width=800, height=400, background_color='white').generate_from_frequencies(dict(freq_items))
+    buf = BytesIO()
+    wordcloud.to_image().save(buf, 'PNG')
+    return buf.getvalue()
+
+def load_analysis(username, include_user_info, include_activity, include_tech_stack, include_forks):
+    """Fetch and analyze a user's data once, keeping the result in session state"""
+    with st.status(f"Fetching data for {username}...") as status:
+        # Get user info and activity
+        profile = _fetch_profile(username, include_user_info, include_activity)
+        user_info = profile['user_info']
+        events = profile['events']
         activity_analysis = analyzer.analyze_user_activity(events) if events else None
         
-    if repos is None:
+        # A finished analysis from today skips the repository fetch and aggregation
+        analysis_key = f"analysis:{username}:{include_tech_stack}:{include_forks}:{date.today().isoformat()}"
+        analysis = _analysis_cache().get(analysis_key)
+        repos = None
+        if analysis is None:
+            # Get repositories
+            repos = _fetch_repos(username, status)
+            if repos:
+                analysis = _analyze(analysis_key, username, include_tech_stack, include_forks, repos)
+                _analysis_cache().set(analysis_key, analysis)
+        
+        failed = analysis is None and repos is None
+        status.update(label=f"Fetched data for {username}", state="error" if failed else "complete")
+    
+    st.session_state.pop("report", None)
+    st.session_state.pop("repo_page", None)
+    if analysis is not None:
+        st.session_state["report"] = {
+            'username': username,
+            'analysis_key': analysis_key,
+            'user_info': user_info,
+            'activity_analysis': activity_analysis,
+            'analysis': analysis
+        }
+    elif repos is None:
         st.error("User not found or API rate limit exceeded. Try again later.")
-    elif not repos:
-        st.warning("This user has no repositories or they are all private.")
     else:
-        analysis = analyzer.analyze_repos(repos, username)
-        
-        # Update rate limit info in sidebar
-        rate_limit_placeholder.info(f"API Requests: {analysis['request_count']} | Remaining: {analysis['rate_limit_remaining']}")
-        
-        # Display user info if available
-        if user_info:
-            with st.expander("User Profile", expanded=True):
-                col1, col2, col3 = st.columns([1, 2, 1])
-                
-                with col1:
-                    st.image(user_info.get('avatar_url', ''), width=150)
-                
-                with col2:
-                    st.subheader(user_info.get('name', username))
-                    st.write(user_info.get('bio', 'No bio available'))
-                    st.write(f"📍 {user_info.get('location', 'Not specified')}")
-                    st.write(f"👥 Followers: {user_info.get('followers', 0)} | Following: {user_info.get('following', 0)}")
-                    
-                with col3:
-                    st.write(f"📊 Public repos: {user_info.get('public_repos', 0)}")
-                    st.write(f"📝 Public gists: {user_info.get('public_gists', 0)}")
-                    st.write(f"🕒 Created: {user_info.get('created_at', '')[:10]}")
-        
-        # Display metrics in tabs
-        tab1, tab2, tab3, tab4, tab5 = st.tabs(["Overview", "Languages", "Repositories", "Activity", "Tech Stack"])
-        
-        with tab1:
-            st.markdown('<div class="sub-header">Overview Metrics</div>', unsafe_allow_html=True)
-            
-            # Key metrics
-            col1, col2, col3, col4 = st.columns(4)
+        st.warning("This user has no repositories or they are all private.")
+
+@st.fragment
+def render_analysis():
+    """Render the stored analysis; widget changes inside only rerun this fragment"""
+    report = st.session_state["report"]
+    username = report['username']
+    analysis_key = report['analysis_key']  # Identifies the analysis for caches that skip hashing repos_df
+    user_info = report['user_info']
+    activity_analysis = report['activity_analysis']
+    analysis = report['analysis']
+    repos_df = analysis['repos_df']
+    
+    # Update rate limit info in sidebar
+    remaining = " | ".join(f"{resource}: {count}" for resource, count in sorted(analyzer.rate_limits.items()))
+    rate_limit_placeholder.info(f"API Requests: {analyzer.request_count} | Remaining ({remaining})")
+    
+    # Display user info if available
+    if user_info:
+        with st.expander("User Profile", expanded=True):
+            col1, col2, col3 = st.columns([1, 2, 1])
             
             with col1:
-                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                st.markdown(f'<div class="metric-value">{analysis["repo_count"]}</div>', unsafe_allow_html=True)
-                st.markdown('<div class="metric-label">Total Repositories</div>', unsafe_allow_html=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-                
+                st.image(user_info.get('avatar_url', ''), width=150)
+            
             with col2:
-                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                st.markdown(f'<div class="metric-value">{analysis["most_used_language"]}</div>', unsafe_allow_html=True)
-                st.markdown('<div class="metric-label">Top Language</div>', unsafe_allow_html=True)
-                st.markdown('</div>', unsafe_allow_html=True)
+                st.subheader(user_info.get('name', username))
+                st.write(user_info.get('bio', 'No bio available'))
+                st.write(f"📍 {user_info.get('location', 'Not specified')}")
+                st.write(f"👥 Followers: {user_info.get('followers', 0)} | Following: {user_info.get('following', 0)}")
                 
             with col3:
-                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                st.markdown(f'<div class="metric-value">{analysis["total_stars"]}</div>', unsafe_allow_html=True)
-                st.markdown('<div class="metric-label">Total Stars</div>', unsafe_allow_html=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-            with col4:
-                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                st.markdown(f'<div class="metric-value">{analysis["total_forks"]}</div>', unsafe_allow_html=True)
-                st.markdown('<div class="metric-label">Total Forks</div>', unsafe_allow_html=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-            
-            # Additional metrics
-            col5, col6, col7, col8 = st.columns(4)
-            
-            with col5:
-                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                st.markdown(f'<div class="metric-value">{analysis["active_repos"]}</div>', unsafe_allow_html=True)
-                st.markdown('<div class="metric-label">Active Repos (90d)</div>', unsafe_allow_html=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-            with col6:
-                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                st.markdown(f'<div class="metric-value">{analysis["fork_repos"]}</div>', unsafe_allow_html=True)
-                st.markdown('<div class="metric-label">Forked Repos</div>', unsafe_allow_html=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-            with col7:
-                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                st.markdown(f'<div class="metric-value">{analysis["archived_repos"]}</div>', unsafe_allow_html=True)
-                st.markdown('<div class="metric-label">Archived Repos</div>', unsafe_allow_html=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-            with col8:
-                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                st.markdown(f'<div class="metric-value">{analysis["avg_contributors"]:.1f}</div>', unsafe_allow_html=True)
-                st.markdown('<div class="metric-label">Avg Contributors</div>', unsafe_allow_html=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-            
-            # Repository age and activity
-            col9, col10, col11, col12 = st.columns(4)
-            
-            with col9:
-                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                st.markdown(f'<div class="metric-value">{analysis["avg_repo_age"]:.0f}</div>', unsafe_allow_html=True)
-                st.markdown('<div class="metric-label">Avg Repo Age (days)</div>', unsafe_allow_html=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-            with col10:
-                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                st.markdown(f'<div class="metric-value">{analysis["avg_days_since_update"]:.0f}</div>', unsafe_allow_html=True)
-                st.markdown('<div class="metric-label">Avg Days Since Update</div>', unsafe_allow_html=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-            with col11:
-                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                st.markdown(f'<div class="metric-value">{analysis["avg_commits"]:.0f}</div>', unsafe_allow_html=True)
-                st.markdown('<div class="metric-label">Avg Commits (last year)</div>', unsafe_allow_html=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-            with col12:
-                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                st.markdown(f'<div class="metric-value">{analysis["total_issues"]}</div>', unsafe_allow_html=True)
-                st.markdown('<div class="metric-label">Open Issues</div>', unsafe_allow_html=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-            
-            # Activity summary
-            st.markdown('<div class="sub-header">Repository Health Summary</div>', unsafe_allow_html=True)
-            
-            # Calculate health score based on various factors
-            health_score = 0
-            max_score = 100
-            
-            # Score based on activity (days since update)
-            if analysis["avg_days_since_update"] < 30:
-                health_score += 30
-                activity_status = "Very Active"
-            elif analysis["avg_days_since_update"] < 90:
-                health_score += 20
-                activity_status = "Active"
-            elif analysis["avg_days_since_update"] < 180:
-                health_score += 10
-                activity_status = "Moderately Active"
-            else:
-                activity_status = "Inactive"
+                st.write(f"📊 Public repos: {user_info.get('public_repos', 0)}")
+                st.write(f"📝 Public gists: {user_info.get('public_gists', 0)}")
+                st.write(f"🕒 Created: {user_info.get('created_at', '')[:10]}")
+    
+    # Display metrics in tabs
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["Overview", "Languages", "Repositories", "Activity", "Tech Stack"])
+    
+    with tab1:
+        sub_header("Overview Metrics")
+        
+        # Key metrics, additional metrics, then repository age and activity; one grid of 4 columns
+        overview_metrics = [
+            ("Total Repositories", analysis["repo_count"]),
+            ("Top Language", analysis["most_used_language"]),
+            ("Total Stars", analysis["total_stars"]),
+            ("Total Forks", analysis["total_forks"]),
+            ("Active Repos (90d)", analysis["active_repos"]),
+            ("Forked Repos", analysis["fork_repos"]),
+            ("Archived Repos", analysis["archived_repos"]),
+            ("Avg Contributors", format_mean(analysis["avg_contributors"], '.1f')),
+            ("Avg Repo Age (days)", f'{analysis["avg_repo_age"]:.0f}'),
+            ("Avg Days Since Update", f'{analysis["avg_days_since_update"]:.0f}'),
+            ("Avg Commits (last year)", format_mean(analysis["avg_commits"], '.0f')),
+            ("Open Issues", analysis["total_issues"])
+        ]
+        metric_cols = st.columns(4)
+        for i, (label, value) in enumerate(overview_metrics):
+            metric_cols[i % 4].metric(label, value)
+        
+        # Activity summary
+        sub_header("Repository Health Summary")
+        
+        # Calculate health score based on various factors
+        engagement = (analysis["avg_stars"] + analysis["avg_forks"]) / 2
+        issue_ratio = analysis["total_issues"] / analysis["repo_count"] if analysis["repo_count"] > 0 else 0
+        archived_ratio = analysis["archived_repos"] / analysis["repo_count"] if analysis["repo_count"] > 0 else 0
+        health_score, activity_status, engagement_status, maintenance_status = health_summary(
+            analysis["avg_days_since_update"], engagement, issue_ratio, archived_ratio)
+        
+        # Display health score
+        health_col1, health_col2, health_col3 = st.columns(3)
+        
+        with health_col1:
+            st.metric("Health Score", f"{health_score}/100")
+            st.progress(health_score / 100)
+        
+        with health_col2:
+            st.markdown("**Activity Status:**")
+            st.info(f"📈 {activity_status}")
             
-            # Score based on community engagement
-            engagement = (analysis["avg_stars"] + analysis["avg_forks"]) / 2
-            if engagement > 50:
-                health_score += 30
-                engagement_status = "High Engagement"
-            elif engagement > 10:
-                health_score += 20
-                engagement_status = "Good Engagement"
-            elif engagement > 1:
-                health_score += 10
-                engagement_status = "Low Engagement"
-            else:
-                engagement_status = "Minimal Engagement"
+            st.markdown("**Engagement Status:**")
+            st.info(f"👥 {engagement_status}")
             
-            # Score based on maintenance (issues and archived status)
-            issue_ratio = analysis["total_issues"] / analysis["repo_count"] if analysis["repo_count"] > 0 else 0
-            if issue_ratio < 5 and analysis["archived_repos"] == 0:
-                health_score += 40
-                maintenance_status = "Well Maintained"
-            elif issue_ratio < 10 and analysis["archived_repos"] / analysis["repo_count"] < 0.2:
-                health_score += 25
-                maintenance_status = "Moderately Maintained"
-            else:
-                maintenance_status = "Needs Attention"
+        with health_col3:
+            st.markdown("**Maintenance Status:**")
+            st.info(f"🔧 {maintenance_status}")
+    
+    with tab2:
+        sub_header("Language Analysis")
+        
+        # Language distribution chart
+        lang_items = tuple(sorted((k, v) for k, v in analysis["language_distribution"].items() if k and k != "Unknown"))
+        
+        if lang_items:
+            col1, col2 = st.columns(2)
             
-            # Display health score
-            health_col1, health_col2, health_col3 = st.columns(3)
+            with col1:
+                fig = build_lang_pie(lang_items)
+                st.plotly_chart(fig, width="content")
             
-            with health_col1:
-                st.plotly_chart(go.Figure(go.Indicator(
-                    mode = "gauge+number",
-                    value = health_score,
-                    domain = {'x': [0, 1], 'y': [0, 1]},
-                    title = {'text': "Health Score"},
-                    gauge = {
-                        'axis': {'range': [0, 100]},
-                        'bar': {'color': "darkblue"},
-                        'steps': [
-                            {'range': [0, 33], 'color': "lightcoral"},
-                            {'range': [33, 66], 'color': "lightyellow"},
-                            {'range': [66, 100], 'color': "lightgreen"}
-                        ]
-                    }
-                )), use_container_width=True)
+            with col2:
+                # Prepare data for bar chart
+                lang_df = pd.DataFrame(lang_items, columns=['Language', 'Count']).sort_values('Count', ascending=False)
+                st.markdown("**Languages by Repository Count**")
+                st.bar_chart(lang_df, x='Language', y='Count', sort='-Count')
             
-            with health_col2:
-                st.markdown("**Activity Status:**")
-                st.info(f"📈 {activity_status}")
-                
-                st.markdown("**Engagement Status:**")
-                st.info(f"👥 {engagement_status}")
-                
-            with health_col3:
-                st.markdown("**Maintenance Status:**")
-                st.info(f"🔧 {maintenance_status}")
-        
-        with tab2:
-            st.markdown('<div class="sub-header">Language Analysis</div>', unsafe_allow_html=True)
+            # Detailed language breakdown by bytes
+            st.markdown("**Detailed Language Breakdown**")
             
-            # Language distribution chart
-            lang_data = [{"Language": k, "Count": v} for k, v in analysis["language_distribution"].items() if k and k != "Unknown"]
+            # Language bytes are summed across repos once by the cached analysis
+            language_bytes = analysis['language_bytes']
             
-            if lang_data:
-                col1, col2 = st.columns(2)
+            if language_bytes:
+                # Convert to MB for readability
+                lang_bytes_df = pd.DataFrame({'Language': list(language_bytes),
+                                              'Size (MB)': [v / 1024 for v in language_bytes.values()]})
                 
-                with col1:
-                    fig = px.pie(lang_data, values='Count', names='Language', 
-                                title='Programming Languages Distribution')
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    # Prepare data for bar chart
-                    lang_df = pd.DataFrame(lang_data).sort_values('Count', ascending=False)
-                    fig = px.bar(lang_df, x='Language', y='Count', 
-                                title='Languages by Repository Count')
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                # Detailed language breakdown by bytes
-                st.markdown("**Detailed Language Breakdown**")
-                
-                # Collect language bytes data from all repos
-                language_bytes = {}
-                for repo in analysis['repos']:
-                    if repo['languages']:
-                        for lang, bytes_count in repo['languages'].items():
-                            if lang in language_bytes:
-                                language_bytes[lang] += bytes_count
-                            else:
-                                language_bytes[lang] = bytes_count
-                
-                if language_bytes:
-                    # Convert to MB for readability
-                    language_mb = {k: v / 1024 for k, v in language_bytes.items()}
-                    lang_bytes_data = [{"Language": k, "Size (MB)": v} for k, v in language_mb.items()]
-                    lang_bytes_df = pd.DataFrame(lang_bytes_data).sort_values('Size (MB)', ascending=False)
-                    
-                    fig = px.bar(lang_bytes_df.head(10), x='Language', y='Size (MB)', 
-                                title='Top Languages by Code Size (MB)')
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.info("No detailed language data available.")
+                st.caption("Top Languages by Code Size (MB)")
+                st.bar_chart(lang_bytes_df.head(10), x='Language', y='Size (MB)', sort='-Size (MB)')
             else:
-                st.info("No language data available.")
+                st.info("No detailed language data available.")
+        else:
+            st.info("No language data available.")
+    
+    with tab3:
+        sub_header("Repository Details")
         
-        with tab3:
-            st.markdown('<div class="sub-header">Repository Details</div>', unsafe_allow_html=True)
+        # Filters
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            filter_language = st.selectbox("Filter by Language", 
+                                         options=["All"] + list(analysis["language_distribution"].keys()))
+        
+        with col2:
+            sort_option = st.selectbox("Sort by", 
+                                     options=list(SORT_COLUMNS))
+        
+        with col3:
+            min_stars = st.slider("Minimum Stars", 0, 1000, 0)
+        
+        # Apply filters and sorting
+        filtered_df = _filter_repos(repos_df, filter_language, sort_option, min_stars)
+        
+        # Paginate so only one page of repositories is sent to the browser
+        page_count = max((len(filtered_df) - 1) // REPOS_PER_PAGE + 1, 1)
+        page = min(st.session_state.setdefault("repo_page", 0), page_count - 1)
+        start = page * REPOS_PER_PAGE
+        page_repos = filtered_df.iloc[start:start + REPOS_PER_PAGE]
+        
+        if not filtered_df.empty:
+            st.write(f"Showing {start + 1}-{start + len(page_repos)} of {len(filtered_df)} repositories")
+        
+        # Display repositories as a single table
+        repo_columns = ['name', 'language', 'stars', 'forks', 'watchers', 'size', 'open_issues',
+                        'license', 'contributors_count', 'created_at', 'updated_at', 'url']
+        repos_table = page_repos[repo_columns].copy()
+        
+        max_stars = max(int(repos_df['stars'].max()), 1)
+        selection = st.dataframe(
+            repos_table,
+            column_config={
+                "name": st.column_config.TextColumn("Repository"),
+                "language": st.column_config.TextColumn("Language"),
+                "stars": st.column_config.ProgressColumn("⭐ Stars", format="%d", min_value=0, max_value=max_stars),
+                "forks": st.column_config.NumberColumn("🍴 Forks"),
+                "watchers": st.column_config.NumberColumn("Watchers"),
+                "size": st.column_config.NumberColumn("Size (KB)"),
+                "open_issues": st.column_config.NumberColumn("Open Issues"),
+                "license": st.column_config.TextColumn("License"),
+                "contributors_count": st.column_config.NumberColumn("Contributors", format="%d"),
+                "created_at": st.column_config.DatetimeColumn("Created", format="YYYY-MM-DD"),
+                "updated_at": st.column_config.DatetimeColumn("Updated", format="YYYY-MM-DD"),
+                "url": st.column_config.LinkColumn("GitHub")
+            },
+            hide_index=True,
+            width="stretch",
+            on_select="rerun",
+            selection_mode="single-row",
+            # Streamlit ties a selection to the key, not the rows; a new view gets a fresh selection
+            key=f"repo_table:{analysis_key}:{filter_language}:{sort_option}:{min_stars}:{page}"
+        )
+        st.caption("Select a row to see the repository's details.")
+        
+        prev_col, next_col = st.columns(2)
+        prev_col.button("◀ Previous", disabled=page == 0,
+                        on_click=lambda: st.session_state.update(repo_page=page - 1))
+        next_col.button("Next ▶", disabled=page >= page_count - 1,
+                        on_click=lambda: st.session_state.update(repo_page=page + 1))
+        
+        # Show full details for a single selected repository
+        selected_rows = selection.selection.rows
+        if selected_rows and selected_rows[0] < len(page_repos):
+            repo = page_repos.iloc[selected_rows[0]]
             
-            # Filters
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                filter_language = st.selectbox("Filter by Language", 
-                                             options=["All"] + list(analysis["language_distribution"].keys()))
+                st.write(f"**Language:** {repo['language']}")
+                st.write(f"**Stars:** {repo['stars']}")
+                st.write(f"**Forks:** {repo['forks']}")
+                st.write(f"**Watchers:** {repo['watchers']}")
             
             with col2:
-                sort_option = st.selectbox("Sort by", 
-                                         options=["Stars", "Forks", "Recent Update", "Size", "Age"])
+                st.write(f"**Size:** {repo['size']} KB")
+                st.write(f"**Open Issues:** {repo['open_issues']}")
+                st.write(f"**License:** {repo['license']}")
+                contributors = repo['contributors_count']
+                st.write(f"**Contributors:** {'Not fetched' if pd.isna(contributors) else int(contributors)}")
             
             with col3:
-                min_stars = st.slider("Minimum Stars", 0, 1000, 0)
+                st.write(f"**Created:** {repo['created_date']}")
+                st.write(f"**Updated:** {repo['updated_date']}")
+                st.write(f"**Age:** {repo['repo_age_days']} days")
+                st.write(f"**Last Update:** {repo['days_since_update']} days ago")
             
-            # Apply filters
-            filtered_repos = analysis["repos"]
+            st.write(f"**Description:** {repo['description']}")
             
-            if filter_language != "All":
-                filtered_repos = [repo for repo in filtered_repos if repo["language"] == filter_language]
-            
-            filtered_repos = [repo for repo in filtered_repos if repo["stars"] >= min_stars]
+            # Fetch the README only when its preview is requested
+            if st.toggle("Show README preview", key=f"readme_{repo['name']}"):
+                readme = _readme(repo['owner'], repo['name'])
+                if readme:
+                    # Display first 500 characters of README
+                    readme_preview = readme[:500] + "..." if len(readme) > 500 else readme
+                    st.text(readme_preview)
+                else:
+                    st.info("No README found for this repository.")
+            st.markdown(f"[View on GitHub]({repo['url']})")
+    
+    with tab4:
+        sub_header("Activity Analysis")
+        
+        if activity_analysis:
+            # Event types chart
+            if activity_analysis["event_types"]:
+                event_df = pd.DataFrame(list(activity_analysis["event_types"].items()),
+                                        columns=['Event Type', 'Count']).sort_values('Count', ascending=False)
+                st.markdown("**User Activity by Event Type**")
+                st.bar_chart(event_df, x='Event Type', y='Count', sort='-Count')
             
-            # Apply sorting
-            if sort_option == "Stars":
-                filtered_repos.sort(key=lambda x: x["stars"], reverse=True)
-            elif sort_option == "Forks":
-                filtered_repos.sort(key=lambda x: x["forks"], reverse=True)
-            elif sort_option == "Size":
-                filtered_repos.sort(key=lambda x: x["size"], reverse=True)
-            elif sort_option == "Age":
-                filtered_repos.sort(key=lambda x: x["repo_age_days"], reverse=True)
-            else:  # Recent Update
-                filtered_repos.sort(key=lambda x: x["updated_at"], reverse=True)
+            # Repository activity chart
+            if activity_analysis["repo_activity"]:
+                repo_activity_df = pd.DataFrame(list(activity_analysis["repo_activity"].items()),
+                                                columns=['Repository', 'Activity']).nlargest(10, 'Activity')
+                st.markdown("**Most Active Repositories**")
+                st.bar_chart(repo_activity_df, x='Repository', y='Activity', sort='-Activity')
+        else:
+            st.info("No activity data available. This might be due to rate limiting or user privacy settings.")
+        
+        # Repository update timeline
+        st.markdown("**Repository Update Timeline**")
+        
+        # Prepare data for update timeline
+        update_df = repos_df.loc[repos_df['updated_at'].notna(), ['name', 'updated_at', 'stars']].rename(columns={
+            'name': 'Repository',
+            'updated_at': 'Last Update',
+            'stars': 'Stars'
+        })
+        
+        if not update_df.empty:
+            update_df = update_df.sort_values('Last Update')
             
-            # Display repositories
-            for i, repo in enumerate(filtered_repos):
-                with st.expander(f"{i+1}. {repo['name']} | ⭐ {repo['stars']} | 🍴 {repo['forks']} | {repo['language'] or 'Unknown'}", expanded=False):
-                    col1, col2, col3 = st.columns(3)
-                    
-                    with col1:
-                        st.write(f"**Language:** {repo['language']}")
-                        st.write(f"**Stars:** {repo['stars']}")
-                        st.write(f"**Forks:** {repo['forks']}")
-                        st.write(f"**Watchers:** {repo['watchers']}")
-                    
-                    with col2:
-                        st.write(f"**Size:** {repo['size']} KB")
-                        st.write(f"**Open Issues:** {repo['open_issues']}")
-                        st.write(f"**License:** {repo['license']}")
-                        st.write(f"**Contributors:** {repo['contributors_count']}")
-                    
-                    with col3:
-                        st.write(f"**Created:** {repo['created_at'][:10]}")
-                        st.write(f"**Updated:** {repo['updated_at'][:10]}")
-                        st.write(f"**Age:** {repo['repo_age_days']} days")
-                        st.write(f"**Last Update:** {repo['days_since_update']} days ago")
-                    
-                    st.write(f"**Description:** {repo['description']}")
-                    
-                    # Show README preview if available
-                    if repo['readme']:
-                        with st.expander("README Preview"):
-                            # Display first 500 characters of README
-                            readme_preview = repo['readme'][:500] + "..." if len(repo['readme']) > 500 else repo['readme']
-                            st.text(readme_preview)
-                    st.markdown(f"[View on GitHub]({repo['url']})")
+            # Days since update is implied by the date axis, so points are sized by stars only
+            st.scatter_chart(update_df, x='Last Update', y='Repository', size='Stars')
+        else:
+            st.info("No update data available.")
+    
+    with tab5:
+        sub_header("Technology Stack Analysis")
         
-        with tab4:
-            st.markdown('<div class="sub-header">Activity Analysis</div>', unsafe_allow_html=True)
+        if analysis["tech_stack_distribution"]:
+            # Tech stack chart
+            tech_df = pd.DataFrame(list(analysis["tech_stack_distribution"].items()),
+                                   columns=['Technology', 'Count']).sort_values('Count', ascending=False)
             
-            if activity_analysis:
-                # Event types chart
-                event_data = [{"Event Type": k, "Count": v} for k, v in activity_analysis["event_types"].items()]
-                if event_data:
-                    event_df = pd.DataFrame(event_data).sort_values('Count', ascending=False)
-                    fig = px.bar(event_df, x='Event Type', y='Count', 
-                                title='User Activity by Event Type')
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                # Repository activity chart
-                repo_activity_data = [{"Repository": k, "Activity": v} for k, v in activity_analysis["repo_activity"].items()]
-                if repo_activity_data:
-                    repo_activity_df = pd.DataFrame(repo_activity_data).sort_values('Activity', ascending=False).head(10)
-                    fig = px.bar(repo_activity_df, x='Repository', y='Activity', 
-                                title='Most Active Repositories')
-                    st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.info("No activity data available. This might be due to rate limiting or user privacy settings.")
+            st.markdown("**Technology Stack Distribution**")
+            st.bar_chart(tech_df, x='Technology', y='Count', sort='-Count')
             
-            # Repository update timeline
-            st.markdown("**Repository Update Timeline**")
+            # Tech stack word cloud
+            st.markdown("**Technology Word Cloud**")
             
-            # Prepare data for update timeline
-            update_data = []
-            for repo in analysis['repos']:
-                if repo['updated_at']:
-                    update_data.append({
-                        'Repository': repo['name'],
-                        'Last Update': repo['updated_at'][:10],
-                        'Days Since Update': repo['days_since_update'],
-                        'Stars': repo['stars']
-                    })
+            # Generate and display the word cloud
+            st.image(_wordcloud_png(tuple(sorted(analysis["tech_stack_distribution"].items()))),
+                     width="stretch")
             
-            if update_data:
-                update_df = pd.DataFrame(update_data)
-                update_df['Last Update'] = pd.to_datetime(update_df['Last Update'])
-                update_df = update_df.sort_values('Last Update')
-                
-                fig = px.scatter(update_df, x='Last Update', y='Repository', 
-                                size='Stars', color='Days Since Update',
-                                title='Repository Update Timeline',
-                                labels={'Last Update': 'Date of Last Update', 'Repository': 'Repository Name'})
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.info("No update data available.")
-        
-        with tab5:
-            st.markdown('<div class="sub-header">Technology Stack Analysis</div>', unsafe_allow_html=True)
+            # Tech stack by repository
+            st.markdown("**Technologies by Repository**")
             
-            if analysis["tech_stack_distribution"]:
-                # Tech stack chart
-                tech_data = [{"Technology": k, "Count": v} for k, v in analysis["tech_stack_distribution"].items()]
-                tech_df = pd.DataFrame(tech_data).sort_values('Count', ascending=False)
-                
-                fig = px.bar(tech_df, x='Technology', y='Count', 
-                            title='Technology Stack Distribution')
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Tech stack word cloud
-                st.markdown("**Technology Word Cloud**")
-                
-                # Generate word cloud
-                wordcloud = WordCloud(width=800, height=400, background_color='white').generate_from_frequencies(analysis["tech_stack_distribution"])
-                
-                # Display the word cloud
-                fig, ax = plt.subplots(figsize=(10, 5))
-                ax.imshow(wordcloud, interpolation='bilinear')
-                ax.axis('off')
-                st.pyplot(fig)
-                
-                # Tech stack by repository
-                st.markdown("**Technologies by Repository**")
-                
-                tech_repo_data = []
-                for repo in analysis['repos']:
-                    for tech in repo['tech_stack']:
-                        tech_repo_data.append({
-                            'Repository': repo['name'],
-                            'Technology': tech,
-                            'Stars': repo['stars']
-                        })
+            tech_repo_df = (repos_df[['name', 'tech_stack', 'stars']].explode('tech_stack')
+                            .dropna(subset=['tech_stack'])
+                            .rename(columns={'name': 'Repository', 'tech_stack': 'Technology', 'stars': 'Stars'}))
+            
+            if not tech_repo_df.empty:
+                # Scatter (technology, repository) pairs into a compact count matrix
+                repo_cat = pd.Categorical(tech_repo_df['Repository'])
+                tech_cat = pd.Categorical(tech_repo_df['Technology'])
+                heatmap_data = np.zeros((len(tech_cat.categories), len(repo_cat.categories)), dtype=np.uint16)
+                np.add.at(heatmap_data, (tech_cat.codes, repo_cat.codes), 1)
                 
-                if tech_repo_data:
-                    tech_repo_df = pd.DataFrame(tech_repo_data)
-                    
-                    # Pivot table for heatmap
-                    heatmap_data = tech_repo_df.groupby(['Repository', 'Technology']).size().unstack(fill_value=0)
-                    
-                    # Create heatmap
-                    fig = px.imshow(heatmap_data.T, 
-                                    title='Technologies Used in Each Repository',
-                                    aspect='auto')
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.info("No technology-repository mapping data available.")
+                # Create heatmap
+                fig = px.imshow(heatmap_data,
+                                x=list(repo_cat.categories), y=list(tech_cat.categories),
+                                labels={'x': 'Repository', 'y': 'Technology', 'color': 'Count'},
+                                title='Technologies Used in Each Repository',
+                                aspect='auto')
+                st.plotly_chart(fig, width="stretch")
             else:
-                st.info("No technology stack data found in README files.")
-        
-        # Export options
-        st.markdown("---")
-        st.markdown('<div class="sub-header">Export Data</div>', unsafe_allow_html=True)
-        
-        # Create DataFrame for export
-        export_data = []
-        for repo in analysis['repos']:
-            export_data.append({
-                'Name': repo['name'],
-                'Language': repo['language'],
-                'Stars': repo['stars'],
-                'Forks': repo['forks'],
-                'Size_KB': repo['size'],
-                'Watchers': repo['watchers'],
-                'Open_Issues': repo['open_issues'],
-                'Created_At': repo['created_at'],
-                'Updated_At': repo['updated_at'],
-                'Days_Since_Update': repo['days_since_update'],
-                'Repo_Age_Days': repo['repo_age_days'],
-                'Contributors': repo['contributors_count'],
-                'Commits_Last_Year': repo['commits_count'],
-                'License': repo['license'],
-                'Is_Fork': repo['is_fork'],
-                'Archived': repo['archived']
-            })
-        
-        export_df = pd.DataFrame(export_data)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # CSV export
-            csv = export_df.to_csv(index=False)
-            st.download_button(
-                label="Download as CSV",
-                data=csv,
-                file_name=f"github_repos_{username}.csv",
-                mime="text/csv"
-            )
-        
-        with col2:
-            # JSON export
-            json = export_df.to_json(indent=2, orient='records')
-            st.download_button(
-                label="Download as JSON",
-                data=json,
-                file_name=f"github_repos_{username}.json",
-                mime="application/json"
-            )
-                
+                st.info("No technology-repository mapping data available.")
+        else:
+            st.info("No technology stack data found in README files.")
+    
+    # Export options
+    st.markdown("---")
+    sub_header("Export Data")
+    
+    csv_gz, jsonl = _export_payloads(analysis_key, repos_df)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # CSV export
+        st.download_button(
+            label="Download as CSV (gzip)",
+            data=csv_gz,
+            file_name=f"github_repos_{username}.csv.gz",
+            mime="application/gzip"
+        )
+    
+    with col2:
+        # JSON Lines export
+        st.download_button(
+            label="Download as JSON Lines",
+            data=jsonl,
+            file_name=f"github_repos_{username}.jsonl",
+            mime="application/jsonl"
+        )
+
+# Fetch once per click; later reruns render the stored analysis without refetching
+if analyze_button and username:
+    load_analysis(username, include_user_info, include_activity, include_tech_stack, include_forks)
+
+if "report" in st.session_state:
+    render_analysis()
 else:
     st.info("👈 Enter a GitHub username in the sidebar and click 'Analyze Repositories' to get started.")
     
@@ -555,7 +623,7 @@ else:
         To get started, enter a GitHub username in the sidebar and click the analyze button.
         """)
         
-        st.image("https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png", width=200)
+        st.html(GITHUB_LOGO_SVG)
 
 # Footer
 st.markdown("---")